@@ -1,21 +1,193 @@
-from skyfield.api import load, Loader
+import concurrent.futures
+import functools
+import re
+from collections import OrderedDict
+from skyfield.api import Loader
+from skyfield.framelib import ecliptic_J2000_frame
 from astroquery.jplhorizons import Horizons
 from astropy.time import Time
+from joblib import Memory
 import numpy as np
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+
+# Decimal places kept when rounding Julian Dates into cache keys.
+_JD_DECIMALS = 9          # ~1e-4 s, for state-vector epochs
+_SKYVIEW_JD_DECIMALS = 5  # ~1 s, for sky-view observation times
+
+# In-memory LRU size per query helper, and size limit of the on-disk Horizons cache.
+_QUERY_CACHE_SIZE = 32
+_DISK_CACHE_BYTES_LIMIT = '100M'
+
+# Number of Earth orbit tracks memoized per set of ephemeris resources.
+_EARTH_ORBIT_CACHE_SIZE = 8
+
+# Gaussian gravitational constant (rad/day) for heliocentric mean motion.
+_GAUSS_K = 0.01720209895
+
+# Horizons step units supported by local Kepler propagation.
+_STEP_UNITS_IN_DAYS = {'d': 1.0, 'h': 1 / 24, 'm': 1 / 1440}
+
+# Horizon circle drawn on both sky-view polar axes.
+_HORIZON_THETA = np.linspace(0, 2 * np.pi, 500)
+_HORIZON_R = np.full(500, 90.0)
+
+
+def _horizons_vectors(target, location, epochs, id_type):
+    """Queries JPL Horizons for the Cartesian position vectors of a target.
+
+    Args:
+        target (str): Name or ID of the target object.
+        location (str): Horizons location code of the coordinate origin.
+        epochs (tuple): Julian Dates, or a (start, stop, step) triple of date strings.
+        id_type (str or None): Type of ID passed through to Horizons.
+
+    Returns:
+        tuple: Read-only arrays of epoch Julian Dates (TDB) and x, y, z positions in AU.
+    """
+    if epochs and isinstance(epochs[0], str):
+        epochs = dict(zip(('start', 'stop', 'step'), epochs))
+    else:
+        epochs = list(epochs)
+    # Caching is handled by AsteroidVisualizer's query cache, not astroquery's
+    vec = Horizons(id=target, location=location, epochs=epochs, id_type=id_type).vectors(cache=False)
+    return tuple(_read_only(vec[c]) for c in ('datetime_jd', 'x', 'y', 'z'))
+
+
+def _horizons_ephemerides(target, location, epochs):
+    """Queries JPL Horizons for the topocentric altitude and azimuth of a target.
+
+    Args:
+        target (str): Name or ID of the target object.
+        location (str): MPC observatory code of the observer.
+        epochs (float): Julian Date of the observation.
+
+    Returns:
+        tuple: Read-only arrays of altitude and azimuth in degrees.
+    """
+    eph = Horizons(id=target, location=location, epochs=epochs).ephemerides(cache=False)
+    return _read_only(eph['EL']), _read_only(eph['AZ'])
+
+
+def _read_only(column):
+    """Converts a table column to a float array that is safe to hand out from a cache."""
+    arr = np.array(column, dtype=float)
+    arr.flags.writeable = False
+    return arr
+
+
+def _step_in_days(step):
+    """Converts a Horizons step string such as '1d', '6h' or '30m' to days.
+
+    Args:
+        step (str): Step size with a 'd', 'h' or 'm' unit suffix.
+
+    Returns:
+        float: Step size in days.
+    """
+    match = re.fullmatch(r'(\d+)\s*([dhm])', step.strip())
+    if match is None:
+        raise ValueError(f"Unsupported step '{step}' for local propagation; use e.g. '1d', '6h' or '30m'.")
+    return int(match.group(1)) * _STEP_UNITS_IN_DAYS[match.group(2)]
+
+
+def propagate_kepler(a, e, i, Omega, omega, M0, epoch, jd_array):
+    """Propagates an elliptic heliocentric orbit from osculating elements (e.g. an MPCORB entry).
+
+    Kepler's equation is solved for all epochs at once using Danby's starter and a fixed
+    number of quartic-convergent iterations, so no per-epoch loop or network query is needed.
+
+    Args:
+        a (float): Semi-major axis in AU.
+        e (float): Eccentricity (0 <= e < 1).
+        i (float): Inclination in degrees.
+        Omega (float): Longitude of the ascending node in degrees.
+        omega (float): Argument of perihelion in degrees.
+        M0 (float): Mean anomaly at `epoch` in degrees.
+        epoch (float): Julian Date of the elements.
+        jd_array (array-like): Julian Dates at which to evaluate the orbit.
+
+    Returns:
+        tuple: Arrays of x, y, z heliocentric ecliptic positions in AU.
+    """
+    n = _GAUSS_K / a ** 1.5
+    M = np.remainder(np.deg2rad(M0) + n * (np.asarray(jd_array, dtype=float) - epoch), 2 * np.pi)
+
+    E = M + 0.85 * e * np.sign(np.sin(M))
+    for _ in range(3):
+        e_sin, e_cos = e * np.sin(E), e * np.cos(E)
+        f = E - e_sin - M
+        d1 = -f / (1 - e_cos)
+        d2 = -f / (1 - e_cos + d1 * e_sin / 2)
+        d3 = -f / (1 - e_cos + d2 * e_sin / 2 + d2 ** 2 * e_cos / 6)
+        E = E + d3
+
+    # Position in the orbital plane with perihelion along +x, then rotate to the ecliptic
+    xp = a * (np.cos(E) - e)
+    yp = a * np.sqrt(1 - e ** 2) * np.sin(E)
+    cos_i, sin_i = np.cos(np.deg2rad(i)), np.sin(np.deg2rad(i))
+    cos_O, sin_O = np.cos(np.deg2rad(Omega)), np.sin(np.deg2rad(Omega))
+    cos_w, sin_w = np.cos(np.deg2rad(omega)), np.sin(np.deg2rad(omega))
+
+    x = (cos_O * cos_w - sin_O * sin_w * cos_i) * xp + (-cos_O * sin_w - sin_O * cos_w * cos_i) * yp
+    y = (sin_O * cos_w + cos_O * sin_w * cos_i) * xp + (-sin_O * sin_w + cos_O * cos_w * cos_i) * yp
+    z = (sin_w * sin_i) * xp + (cos_w * sin_i) * yp
+    return x, y, z
 
 
 class AsteroidVisualizer:
     """A class to visualize asteroid and planet orbits using Skyfield and JPL Horizons."""
 
-    def __init__(self):
-        """Initializes the ephemeris loader, timescale, and celestial bodies (Sun, Earth)."""
-        self.loader = Loader('./skyfield_data')
-        self.eph = self.loader('de421.bsp')
-        self.sun = self.eph['sun']
-        self.earth = self.eph['earth']
-        self.ts = self.loader.timescale()
+    _shared = None
+
+    def __init__(self, cache_dir='./.horizons_cache', use_shared=True):
+        """Initializes the ephemeris loader, timescale, celestial bodies (Sun, Earth), and Horizons query cache.
+
+        Args:
+            cache_dir (str, optional): Directory of the on-disk cache for JPL Horizons queries, which
+                                       backs a per-instance in-memory LRU. Pass None to keep only the
+                                       in-memory layer. Defaults to './.horizons_cache'.
+            use_shared (bool, optional): Reuse the ephemeris and timescale loaded by earlier instances
+                                         instead of loading them again. Defaults to True.
+        """
+        if use_shared:
+            resources, self._earth_orbits = self._get_shared_resources()
+        else:
+            resources, self._earth_orbits = self._load_resources(), OrderedDict()
+        self.loader, self.eph, self.sun, self.earth, self.ts = resources
+        self._skyview_fig = None
+        self._last_time_str, self._last_time_obj = None, None
+
+        memory = Memory(cache_dir, verbose=0)
+        memory.reduce_size(bytes_limit=_DISK_CACHE_BYTES_LIMIT)  # Evict least recently used entries
+        self._vectors = functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)(memory.cache(_horizons_vectors))
+        self._ephemerides = functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)(memory.cache(_horizons_ephemerides))
+
+    @staticmethod
+    def _load_resources():
+        """Loads the DE421 ephemeris and timescale.
+
+        Returns:
+            tuple: The loader, ephemeris, Sun, Earth, and timescale.
+        """
+        loader = Loader('./skyfield_data')
+        eph = loader('de421.bsp')
+        return loader, eph, eph['sun'], eph['earth'], loader.timescale()
+
+    @classmethod
+    def _get_shared_resources(cls):
+        """Returns the ephemeris resources shared by all instances, loading them on first use.
+
+        The Earth orbit memo is created together with the resources, so resetting `_shared`
+        also drops every track computed from them.
+
+        Returns:
+            tuple: The (loader, ephemeris, Sun, Earth, timescale) tuple and the Earth orbit memo.
+        """
+        if cls._shared is None:
+            cls._shared = (cls._load_resources(), OrderedDict())
+        return cls._shared
 
     def get_heliocentric_position(self, target_name, dates_utc, id_type='smallbody'):
         """Gets heliocentric positions (x, y, z) of a Solar System object from JPL Horizons.
@@ -29,12 +201,66 @@ class AsteroidVisualizer:
         Returns:
             tuple: Arrays of x, y, z heliocentric positions in AU.
         """
-        jd_times = [Time(f"{y}-{m:02d}-{d:02d}", format='iso', scale='utc').jd for (y, m, d) in dates_utc]
-        obj = Horizons(id=target_name, location='500', epochs=jd_times, id_type=id_type)
-        eph = obj.vectors()
-        return eph['x'], eph['y'], eph['z']
+        years, months, days = np.asarray(dates_utc, dtype=int).T
+        times = Time({'year': years, 'month': months, 'day': days}, format='ymdhms', scale='utc')
+        return self.get_heliocentric_position_jd(target_name, times.tdb.jd, id_type=id_type)
+
+    def get_heliocentric_position_jd(self, target_name, jd_array, id_type='smallbody'):
+        """Gets heliocentric positions (x, y, z) of a Solar System object at pre-computed Julian Dates.
+
+        Use this when the epochs already exist as a time array (e.g. `t.tdb` of the Skyfield Time
+        driving a computation) to avoid rebuilding them from calendar dates. Horizons interprets
+        state-vector epochs as TDB, so convert other scales first (e.g. astropy `Time(...).tdb.jd`).
+
+        Args:
+            target_name (str): Name or ID of the target object (e.g., 'Ceres', '301').
+            jd_array (array-like): Julian Dates (TDB) of the requested positions.
+            id_type (str, optional): Type of ID (e.g., 'smallbody', 'majorbody', 'designation').
+                                     Defaults to 'smallbody'.
+
+        Returns:
+            tuple: Arrays of x, y, z heliocentric positions in AU.
+        """
+        jd_array = np.round(np.asarray(jd_array, dtype=float), _JD_DECIMALS)
+        # Tolerance absorbs the ms-level TDB-UTC drift between midnights, but not a leap second
+        if jd_array.size > 1 and np.allclose(np.diff(jd_array), 1.0, rtol=0, atol=1e-6):
+            # A contiguous daily range is generated server-side from its (TDB) end points.
+            start, stop = Time(jd_array[[0, -1]], format='jd', scale='tdb').iso
+            epochs = (start, stop, '1d')
+        else:
+            epochs = tuple(jd_array.tolist())
+        _, x, y, z = self._vectors(target_name, '500', epochs, id_type)
+        return x, y, z
+
+    def _earth_orbit(self, jd_tdb):
+        """Computes Earth's heliocentric positions at the given epochs.
+
+        Results are memoized per epoch array alongside the ephemeris resources, so
+        instances sharing those resources share the memo. The arrays are returned read-only.
+
+        Args:
+            jd_tdb (numpy.ndarray): Julian Dates (TDB) of the positions.
+
+        Returns:
+            tuple: Arrays of x, y, z heliocentric positions in AU.
+        """
+        key = np.round(jd_tdb, _JD_DECIMALS).tobytes()
+        if key in self._earth_orbits:
+            self._earth_orbits.move_to_end(key)
+        else:
+            if len(self._earth_orbits) >= _EARTH_ORBIT_CACHE_SIZE:
+                self._earth_orbits.popitem(last=False)  # Evict the least recently used track
+            days = self.ts.tdb_jd(jd_tdb)
+            # Geometric position: light-time and aberration are invisible at orbit-plot scale.
+            # Ecliptic of J2000 is the frame of Horizons '@sun' vectors and of propagate_kepler.
+            pos = (self.earth - self.sun).at(days).frame_xyz(ecliptic_J2000_frame).au
+            pos = np.ascontiguousarray(pos, dtype=float)
+            pos.flags.writeable = False
+            self._earth_orbits[key] = tuple(pos)
+        return self._earth_orbits[key]
 
-    def plot_heliocentric_orbits_3D(self, object_id='Ceres', start='2025-01-01', stop='2025-12-31', step='1d'):
+    def plot_heliocentric_orbits_3D(self, object_id='Ceres', start='2025-01-01', stop='2025-12-31', step='1d',
+                                    max_points=2000, elements=None):
         """Generates a 3D Plotly figure of Earth's and an object's heliocentric orbits.
 
         Args:
@@ -42,30 +268,38 @@ class AsteroidVisualizer:
             start (str, optional): Start date in 'YYYY-MM-DD' format. Defaults to '2025-01-01'.
             stop (str, optional): Stop date in 'YYYY-MM-DD' format. Defaults to '2025-12-31'.
             step (str, optional): Time step for the ephemerides query. Defaults to '1d'.
+            max_points (int, optional): Maximum number of points drawn per orbit trace; longer
+                                        orbits are evenly downsampled. Pass None to draw every point.
+                                        Defaults to 2000.
+            elements (dict, optional): Osculating elements of the object with the keyword arguments of
+                                       `propagate_kepler` (a, e, i, Omega, omega, M0, epoch). When given,
+                                       the orbit is propagated locally instead of queried from JPL Horizons.
+                                       Defaults to None.
 
         Returns:
             plotly.graph_objects.Figure: A 3D Plotly figure with orbits and start-of-year positions.
         """
-        obj = Horizons(id=object_id, location='@sun',
-                       epochs={'start': start, 'stop': stop, 'step': step})
-        obj_vectors = obj.vectors()
-
-        eph = load('de421.bsp')
-        earth = eph['earth']
-        sun = eph['sun']
-        ts = load.timescale()
-
-        start_year = int(start[:4])
-        start_month = int(start[5:7])
-        start_day = int(start[8:10])
-        num_days = len(obj_vectors)
-        days = ts.utc(start_year, start_month, range(start_day, start_day + num_days))
-
-        pos = earth.at(days).observe(sun).apparent().position.au
-        x, y, z = -pos[0], -pos[1], -pos[2]
+        if elements is not None:
+            jd_start, jd_stop = Time([start, stop], scale='utc').tdb.jd
+            step_days = _step_in_days(step)
+            jd_array = np.arange(jd_start, jd_stop + step_days / 2, step_days)
+            obj_xyz = np.stack(propagate_kepler(jd_array=jd_array, **elements))
+        else:
+            jd_array, *xyz = self._vectors(object_id, '@sun', (start, stop, step), None)
+            obj_xyz = np.stack(xyz)
+        # Both sources are already Sun-centred, so the (3, N) rows are plotted as they are;
+        # contiguous float64 rows let Plotly serialize each axis in one pass.
+
+        num_points = obj_xyz.shape[1]
+        if max_points is not None and num_points > max_points:
+            idx = np.linspace(0, num_points - 1, max_points).astype(int)
+            jd_array, obj_xyz = jd_array[idx], obj_xyz[:, idx]
+
+        # Earth is sampled at the object's (downsampled) epochs, whatever the step
+        x, y, z = self._earth_orbit(jd_array)
         x0, y0, z0 = x[0], y[0], z[0]
 
-        x2, y2, z2 = -obj_vectors['x'], -obj_vectors['y'], -obj_vectors['z']
+        x2, y2, z2 = obj_xyz
         x02, y02, z02 = x2[0], y2[0], z2[0]
 
         fig = go.Figure()
@@ -100,28 +334,70 @@ class AsteroidVisualizer:
 
         return fig
 
+    def _skyview_positions(self, objects, obs_code, epoch_jd):
+        """Fetches the altitude and azimuth of every distinct object at one epoch.
+
+        JPL Horizons resolves a single target per request, so duplicate names are
+        collapsed and the remaining objects are queried concurrently, one thread each.
+
+        Args:
+            objects (list of str): List of object names or IDs.
+            obs_code (str): MPC observatory code of the observer.
+            epoch_jd (float): Julian Date of the observation.
+
+        Returns:
+            tuple: Arrays of object names, altitudes, and azimuths (degrees), in query order.
+        """
+        names = list(dict.fromkeys(objects))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(8, len(names)))) as executor:
+            results = list(executor.map(lambda obj: self._ephemerides(obj, obs_code, epoch_jd), names))
+        alt = np.array([el_col[0] for el_col, _ in results])
+        az = np.array([az_col[0] for _, az_col in results])
+        return np.array(names), alt, az
+
     def visualize_skyview(self, objects, obs_code='500', obs_time_utc='2025-08-05 10:00'):
         """Generates polar plots showing object positions above and below the horizon at a given time.
 
         Args:
             objects (list of str): List of object names or IDs to visualize (e.g., ['Sun', '301']).
             obs_code (str, optional): MPC observatory code (e.g., '500' for geocenter). Defaults to '500'.
-            obs_time_utc (str, optional): UTC date and time of observation in 'YYYY-MM-DD HH:MM' format.
-                                          Defaults to '2025-08-05 10:00'.
+            obs_time_utc (str or astropy.time.Time, optional): UTC date and time of observation in
+                                                               'YYYY-MM-DD HH:MM' format (other formats astropy
+                                                               recognizes are also accepted), or an already-built
+                                                               scalar Time. Defaults to '2025-08-05 10:00'.
 
         Returns:
             None: Displays matplotlib polar sky plots of the objects' positions.
+
+        Raises:
+            ValueError: If `obs_time_utc` holds more than one time.
         """
-        t_astropy = Time(obs_time_utc)
-        epoch_jd = t_astropy.jd
+        if isinstance(obs_time_utc, Time):
+            t_astropy = obs_time_utc.utc
+        elif isinstance(obs_time_utc, str) and obs_time_utc == self._last_time_str:
+            t_astropy = self._last_time_obj
+        else:
+            try:
+                t_astropy = Time(obs_time_utc, format='iso', scale='utc')
+            except ValueError:
+                # Fall back to format auto-detection (e.g. 'YYYY-MM-DDTHH:MM' or datetime objects)
+                t_astropy = Time(obs_time_utc, scale='utc')
+            if isinstance(obs_time_utc, str):
+                self._last_time_str, self._last_time_obj = obs_time_utc, t_astropy
+        if not t_astropy.isscalar:
+            raise ValueError("obs_time_utc must be a single time, not an array of times.")
+        epoch_jd = round(t_astropy.jd, _SKYVIEW_JD_DECIMALS)
 
-        positions = {}
-        for obj in objects:
-            horizons_obj = Horizons(id=obj, location=obs_code, epochs=epoch_jd)
-            eph = horizons_obj.ephemerides()
-            positions[obj] = (eph['EL'][0], eph['AZ'][0])  # Altitude, Azimuth
+        names, alt, az = self._skyview_positions(objects, obs_code, epoch_jd)
 
-        fig, (ax_sky, ax_ground) = plt.subplots(1, 2, figsize=(12, 6), subplot_kw=dict(polar=True))
+        # Reuse the figure from the previous call while its window is still open
+        if self._skyview_fig is None or not plt.fignum_exists(self._skyview_fig[0].number):
+            self._skyview_fig = plt.subplots(1, 2, figsize=(12, 6), subplot_kw=dict(polar=True))
+            fig, (ax_sky, ax_ground) = self._skyview_fig
+        else:
+            fig, (ax_sky, ax_ground) = self._skyview_fig
+            ax_sky.clear()
+            ax_ground.clear()
         fig.suptitle(f"Sky View from Observatory {obs_code} – {t_astropy.iso}", fontsize=14)
 
         for ax, title, bgcolor in zip([ax_sky, ax_ground], ["Above Horizon", "Below Horizon"], ['#f5faff', '#eaeaea']):
@@ -130,20 +406,23 @@ class AsteroidVisualizer:
             ax.set_rlim(0, 90)
             ax.set_title(title)
             ax.set_facecolor(bgcolor)
-            ax.plot(np.linspace(0, 2 * np.pi, 500), [90]*500, color='gray', linestyle='--', linewidth=0.5)
+            ax.plot(_HORIZON_THETA, _HORIZON_R, color='gray', linestyle='--', linewidth=0.5)
             ax.set_rlabel_position(135)
 
         colors = {'Sun': 'orange', '301': 'gray'}
-        for obj, (alt, az) in positions.items():
-            az_rad = np.deg2rad(az)
-            radius = 90 - abs(alt)
-            color = colors.get(obj, 'red')  # Default: red
-            if alt >= 0:
-                ax_sky.plot(az_rad, radius, 'o', color=color, label=obj)
-            else:
-                ax_ground.plot(az_rad, radius, 'o', color=color, label=obj)
-
-        ax_sky.legend(loc='lower left')
-        ax_ground.legend(loc='lower left')
-        plt.tight_layout()
+        az_rad = np.deg2rad(az)
+        radius = 90 - np.abs(alt)
+        color_list = np.array([colors.get(obj, 'red') for obj in names])  # Default: red
+        above = alt >= 0
+
+        # One scatter artist per axis; the legend uses a proxy marker per object.
+        for ax, mask in zip([ax_sky, ax_ground], [above, ~above]):
+            if not mask.any():
+                continue
+            ax.scatter(az_rad[mask], radius[mask], c=color_list[mask])
+            handles = [Line2D([], [], marker='o', linestyle='', color=color, label=obj)
+                       for obj, color in zip(names[mask], color_list[mask])]
+            ax.legend(handles=handles, loc='lower left')
+
+        fig.tight_layout()
         plt.show()
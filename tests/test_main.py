@@ -1,12 +1,45 @@
+import gc
+import os
+import tempfile
 import unittest
+import weakref
 from unittest.mock import patch, MagicMock, call
 import numpy as np
 import plotly.graph_objects as go
 from astropy.table import Table
 from astropy.time import Time
+from skyfield.api import Loader
+from skyfield.framelib import ecliptic_J2000_frame
+
+try:
+    import vcr
+except ImportError:  # vcrpy is a test extra; without it the E2E tests are skipped
+    vcr = None
+try:
+    import skyfield_data
+except ImportError:  # test extra providing the DE421 ephemeris offline
+    skyfield_data = None
 
 # make sure to put in root directory
-from astroView.main import AsteroidVisualizer
+from astroView.viewer import AsteroidVisualizer, propagate_kepler
+
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), 'cassettes')
+# Set ASTROVIEW_RECORD_CASSETTES=1 (with network access) to record missing cassettes
+RECORD_CASSETTES = os.environ.get('ASTROVIEW_RECORD_CASSETTES') == '1'
+
+
+def use_cassette(name):
+    """Replays recorded Horizons HTTP traffic for an E2E test.
+
+    The test is skipped when vcrpy is not installed, or when the cassette has not
+    been recorded yet and recording is not enabled.
+    """
+    path = os.path.join(CASSETTE_DIR, name)
+    if vcr is None:
+        return unittest.skip("vcrpy is not installed (pip install .[test])")
+    if not (os.path.exists(path) or RECORD_CASSETTES):
+        return unittest.skip(f"Cassette {name} not recorded; set ASTROVIEW_RECORD_CASSETTES=1 to record it")
+    return vcr.use_cassette(path, record_mode='once')
 
 # fake data production
 def get_mock_horizons_vectors():
@@ -45,7 +78,7 @@ class TestAsteroidVisualizerUnit(unittest.TestCase):
     like file I/O and network requests.
     """
 
-    @patch('astroView.main.Loader')
+    @patch('astroView.viewer.Loader')
     def setUp(self, MockLoader):
         """
         Set up a fresh instance of AsteroidVisualizer for each test.
@@ -54,9 +87,69 @@ class TestAsteroidVisualizerUnit(unittest.TestCase):
         # We mock the Loader to avoid actual file system access during unit tests
         self.mock_loader_instance = MockLoader.return_value
         self.mock_loader_instance.timescale.return_value = "mock_timescale"
-        self.visualizer = AsteroidVisualizer()
+        self.visualizer = AsteroidVisualizer(cache_dir=None, use_shared=False)
+
+    @patch.object(AsteroidVisualizer, '_shared', None)
+    @patch('astroView.viewer.Loader')
+    def test_shared_resources_loaded_once(self, MockLoader):
+        """
+        Instances created with use_shared=True should load the ephemeris
+        and timescale only once and reuse them afterwards.
+        """
+        print("\nRunning test: test_shared_resources_loaded_once")
+        first = AsteroidVisualizer(cache_dir=None)
+        second = AsteroidVisualizer(cache_dir=None)
+
+        MockLoader.assert_called_once()
+        self.assertIs(first.eph, second.eph)
+        self.assertIs(first.ts, second.ts)
+        print("... PASSED")
+
+    @patch.object(AsteroidVisualizer, '_shared', None)
+    @patch('astroView.viewer.Loader')
+    def test_earth_orbit_shared_between_instances(self, MockLoader):
+        """
+        Instances sharing the ephemeris should also share the memoized
+        Earth orbit, and the memo should not keep instances alive.
+        """
+        print("\nRunning test: test_earth_orbit_shared_between_instances")
+        first = AsteroidVisualizer(cache_dir=None)
+        earth_at = first.earth.__sub__.return_value.at
+        earth_at.return_value.frame_xyz.return_value.au = np.zeros((3, 5))
 
-    @patch('astroView.main.Horizons')
+        jd_tdb = 2460676.5 + np.arange(5)
+        x1, _, _ = first._earth_orbit(jd_tdb)
+        first_ref = weakref.ref(first)
+        del first
+        gc.collect()
+        x2, _, _ = AsteroidVisualizer(cache_dir=None)._earth_orbit(jd_tdb.copy())
+
+        earth_at.assert_called_once()
+        self.assertIs(x1, x2)
+        self.assertIsNone(first_ref())
+        print("... PASSED")
+
+    def test_earth_orbit_evicts_least_recently_used(self):
+        """
+        A track that keeps being used should survive eviction when the
+        Earth orbit memo is full.
+        """
+        print("\nRunning test: test_earth_orbit_evicts_least_recently_used")
+        self.visualizer.ts = MagicMock()
+        self.visualizer.earth.__sub__.return_value.at.return_value.frame_xyz.return_value.au = np.zeros((3, 1))
+        tracks = [np.array([2460676.5 + k]) for k in range(9)]
+
+        for jd_tdb in tracks[:8]:
+            self.visualizer._earth_orbit(jd_tdb)
+        self.visualizer._earth_orbit(tracks[0])  # Refresh the first track
+        self.visualizer._earth_orbit(tracks[8])  # Evicts tracks[1], not tracks[0]
+
+        keys = list(self.visualizer._earth_orbits)
+        self.assertIn(tracks[0].tobytes(), keys)
+        self.assertNotIn(tracks[1].tobytes(), keys)
+        print("... PASSED")
+
+    @patch('astroView.viewer.Horizons')
     def test_get_heliocentric_position(self, MockHorizons):
         """
         Unit test for the get_heliocentric_position method.
@@ -78,9 +171,67 @@ class TestAsteroidVisualizerUnit(unittest.TestCase):
         np.testing.assert_array_equal(z, np.array([0.5, 0.4]))
         print("... PASSED")
 
-    @patch('astroView.main.load')
-    @patch('astroView.main.Horizons')
-    def test_plot_heliocentric_orbits_3d(self, MockHorizons, mock_skyfield_load):
+    @patch('astroView.viewer.Horizons')
+    def test_get_heliocentric_position_jd(self, MockHorizons):
+        """
+        Pre-computed Julian Dates should be handed to Horizons unchanged.
+        """
+        print("\nRunning test: test_get_heliocentric_position_jd")
+        MockHorizons.return_value.vectors.return_value = get_mock_horizons_vectors()
+
+        jd_array = np.array([2460676.5, 2460678.25])
+        x, y, z = self.visualizer.get_heliocentric_position_jd('Ceres', jd_array)
+
+        _, kwargs = MockHorizons.call_args
+        self.assertEqual(kwargs['epochs'], [2460676.5, 2460678.25])
+        np.testing.assert_array_equal(x, np.array([-1.5, -1.4]))
+        print("... PASSED")
+
+    @patch('astroView.viewer.Horizons')
+    def test_get_heliocentric_position_daily_range(self, MockHorizons):
+        """
+        Consecutive daily dates should be sent as a start/stop/step range
+        rather than as an explicit list of epochs.
+        """
+        print("\nRunning test: test_get_heliocentric_position_daily_range")
+        MockHorizons.return_value.vectors.return_value = get_mock_horizons_vectors()
+
+        self.visualizer.get_heliocentric_position('Ceres', [(2025, 1, 1), (2025, 1, 2)])
+
+        _, kwargs = MockHorizons.call_args
+        self.assertEqual(kwargs['epochs']['step'], '1d')
+        # UTC midnights are sent as their TDB equivalents (TDB - UTC = 69.184 s in 2025)
+        self.assertEqual(kwargs['epochs']['start'], '2025-01-01 00:01:09.184')
+        self.assertEqual(kwargs['epochs']['stop'], '2025-01-02 00:01:09.184')
+        print("... PASSED")
+
+    @patch('astroView.viewer.Horizons')
+    @patch('astroView.viewer.Loader')
+    def test_get_heliocentric_position_cached(self, MockLoader, MockHorizons):
+        """
+        A repeated query with the same target and dates should be served
+        from the in-memory LRU, and a new instance from the on-disk cache,
+        instead of hitting JPL Horizons again.
+        """
+        print("\nRunning test: test_get_heliocentric_position_cached")
+        MockHorizons.return_value.vectors.return_value = get_mock_horizons_vectors()
+        dates_utc = [(2025, 1, 1), (2025, 1, 2)]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            visualizer = AsteroidVisualizer(cache_dir=cache_dir, use_shared=False)
+            x1, _, _ = visualizer.get_heliocentric_position('Ceres', dates_utc)
+            x2, _, _ = visualizer.get_heliocentric_position('Ceres', dates_utc)
+            other = AsteroidVisualizer(cache_dir=cache_dir, use_shared=False)
+            x3, _, _ = other.get_heliocentric_position('Ceres', dates_utc)
+
+        MockHorizons.assert_called_once()
+        self.assertIs(x1, x2)
+        np.testing.assert_array_equal(x1, x3)
+        self.assertFalse(x1.flags.writeable)
+        print("... PASSED")
+
+    @patch('astroView.viewer.Horizons')
+    def test_plot_heliocentric_orbits_3d(self, MockHorizons):
         """
         Unit test for the plot_heliocentric_orbits_3D method.
         It checks if the Plotly figure is generated correctly.
@@ -89,6 +240,10 @@ class TestAsteroidVisualizerUnit(unittest.TestCase):
         # Arrange: Set up mocks for both Horizons and Skyfield
         mock_horizons_instance = MockHorizons.return_value
         mock_horizons_instance.vectors.return_value = get_mock_horizons_vectors()
+        # The Skyfield bodies and timescale come from the (mocked) instance state
+        self.visualizer.ts = MagicMock()
+        self.visualizer.earth.__sub__.return_value.at.return_value.frame_xyz.return_value.au = \
+            np.array([[0.18, 0.16], [-0.89, -0.89], [-0.39, -0.39]])
 
         # Act: Call the method
         fig = self.visualizer.plot_heliocentric_orbits_3D(object_id='Ceres')
@@ -111,9 +266,109 @@ class TestAsteroidVisualizerUnit(unittest.TestCase):
         self.assertEqual(sun_trace.z[0], 0)
         print("... PASSED")
 
+    @patch('astroView.viewer.Horizons')
+    def test_plot_heliocentric_orbits_3d_max_points(self, MockHorizons):
+        """
+        Orbit traces longer than max_points should be evenly downsampled,
+        keeping the first and last samples.
+        """
+        print("\nRunning test: test_plot_heliocentric_orbits_3d_max_points")
+        n = 10
+        MockHorizons.return_value.vectors.return_value = Table({
+            'x': np.arange(n, dtype=float),
+            'y': np.zeros(n),
+            'z': np.zeros(n),
+            'datetime_jd': 2460676.5 + np.arange(n),
+        })
+        self.visualizer.ts = MagicMock()
+        self.visualizer.earth.__sub__.return_value.at.return_value.frame_xyz.return_value.au = np.zeros((3, 4))
+
+        fig = self.visualizer.plot_heliocentric_orbits_3D(object_id='Ceres', max_points=4)
+
+        earth_trace, ceres_trace = fig.data[0], fig.data[1]
+        self.assertEqual(len(earth_trace.x), 4)
+        self.assertEqual(len(ceres_trace.x), 4)
+        np.testing.assert_array_equal(ceres_trace.x, [0.0, 3.0, 6.0, 9.0])
+        print("... PASSED")
+
+    @patch('astroView.viewer.Horizons')
+    def test_plot_heliocentric_orbits_3d_hourly_step(self, MockHorizons):
+        """
+        With a sub-daily step, Earth must be sampled at the object's epochs
+        rather than at one point per day.
+        """
+        print("\nRunning test: test_plot_heliocentric_orbits_3d_hourly_step")
+        n = 48
+        jd_hourly = 2460676.5 + np.arange(n) / 24
+        MockHorizons.return_value.vectors.return_value = Table({
+            'x': np.ones(n),
+            'y': np.zeros(n),
+            'z': np.zeros(n),
+            'datetime_jd': jd_hourly,
+        })
+        self.visualizer.ts = MagicMock()
+        self.visualizer.earth.__sub__.return_value.at.return_value.frame_xyz.return_value.au = np.zeros((3, 12))
+
+        fig = self.visualizer.plot_heliocentric_orbits_3D(object_id='Ceres', start='2025-01-01',
+                                                          stop='2025-01-02 23:00', step='1h', max_points=12)
+
+        (jd_tdb,), _ = self.visualizer.ts.tdb_jd.call_args
+        np.testing.assert_allclose(jd_tdb, jd_hourly[np.linspace(0, n - 1, 12).astype(int)])
+        self.assertEqual(len(fig.data[0].x), 12)
+        self.assertEqual(len(fig.data[1].x), 12)
+        print("... PASSED")
+
+    def test_propagate_kepler(self):
+        """
+        Unit test for the local Kepler propagator on orbits with known positions.
+        """
+        print("\nRunning test: test_propagate_kepler")
+        epoch = 2460676.5
+        quarter_period = (np.pi / 2) / 0.01720209895
+
+        # Circular orbit in the ecliptic: a quarter period moves +x to +y.
+        # A zero epoch keeps the time offset exact (a JD near 2.46e6 only resolves ~5e-10 d).
+        x, y, z = propagate_kepler(1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, [0.0, quarter_period])
+        np.testing.assert_allclose(x, [1.0, 0.0], atol=1e-12)
+        np.testing.assert_allclose(y, [0.0, 1.0], atol=1e-12)
+        np.testing.assert_allclose(z, [0.0, 0.0], atol=1e-12)
+
+        # Eccentric orbit: perihelion at a(1 - e), aphelion at -a(1 + e)
+        x, y, _ = propagate_kepler(2.0, 0.5, 0.0, 0.0, 0.0, 0.0, epoch, [epoch])
+        np.testing.assert_allclose([x[0], y[0]], [1.0, 0.0], atol=1e-12)
+        x, y, _ = propagate_kepler(2.0, 0.5, 0.0, 0.0, 0.0, 180.0, epoch, [epoch])
+        np.testing.assert_allclose([x[0], y[0]], [-3.0, 0.0], atol=1e-9)
+        print("... PASSED")
+
+    @patch('astroView.viewer.Horizons')
+    def test_plot_heliocentric_orbits_3d_elements(self, MockHorizons):
+        """
+        Supplying orbital elements should propagate the orbit locally
+        without querying JPL Horizons.
+        """
+        print("\nRunning test: test_plot_heliocentric_orbits_3d_elements")
+        self.visualizer.ts = MagicMock()
+        self.visualizer.earth.__sub__.return_value.at.return_value.frame_xyz.return_value.au = np.zeros((3, 10))
+        elements = dict(a=2.77, e=0.08, i=10.6, Omega=80.3, omega=73.4, M0=0.0, epoch=2460676.5)
+
+        fig = self.visualizer.plot_heliocentric_orbits_3D(object_id='Ceres', start='2025-01-01',
+                                                          stop='2025-01-10', elements=elements)
+
+        MockHorizons.assert_not_called()
+        self.assertEqual(len(fig.data[1].x), 10)
+        # The propagated orbit is drawn as-is (not reflected through the Sun)
+        jd_start = Time('2025-01-01', scale='utc').tdb.jd
+        x, y, z = propagate_kepler(jd_array=[jd_start], **elements)
+        np.testing.assert_allclose([fig.data[1].x[0], fig.data[1].y[0], fig.data[1].z[0]],
+                                   [x[0], y[0], z[0]])
+        # Earth is expressed in the same ecliptic J2000 frame
+        frame_xyz = self.visualizer.earth.__sub__.return_value.at.return_value.frame_xyz
+        frame_xyz.assert_called_once_with(ecliptic_J2000_frame)
+        print("... PASSED")
+
     @patch('matplotlib.pyplot.show')
     @patch('matplotlib.pyplot.subplots')
-    @patch('astroView.main.Horizons')
+    @patch('astroView.viewer.Horizons')
     def test_visualize_skyview(self, MockHorizons, mock_subplots, mock_plt_show):
         """
         Unit test for the visualize_skyview method.
@@ -141,85 +396,172 @@ class TestAsteroidVisualizerUnit(unittest.TestCase):
         # Act: Call the method
         self.visualizer.visualize_skyview(['Sun', 'Moon'])
 
-        # Assert: Check that the correct plot calls were made
+        # Assert: Check that the correct scatter calls were made
         # The Sun (altitude > 0) should be plotted on the 'sky' axis
-        mock_ax_sky.plot.assert_called_once()
+        mock_ax_sky.scatter.assert_called_once()
         # The Moon (altitude < 0) should be plotted on the 'ground' axis
-        mock_ax_ground.plot.assert_called_once()
-        
-        # We can even check the arguments of the plot call for the Sun
-        args, kwargs = mock_ax_sky.plot.call_args
+        mock_ax_ground.scatter.assert_called_once()
+
+        # We can even check the arguments of the scatter call for the Sun
+        args, kwargs = mock_ax_sky.scatter.call_args
         az_rad_sun = np.deg2rad(120.0)
         radius_sun = 90 - 30.0
-        self.assertAlmostEqual(args[0], az_rad_sun)
-        self.assertAlmostEqual(args[1], radius_sun)
-        self.assertEqual(kwargs['label'], 'Sun')
-        
+        np.testing.assert_allclose(args[0], [az_rad_sun])
+        np.testing.assert_allclose(args[1], [radius_sun])
+        self.assertEqual(list(kwargs['c']), ['orange'])
+        _, kwargs = mock_ax_sky.legend.call_args
+        self.assertEqual([h.get_label() for h in kwargs['handles']], ['Sun'])
+
         # And for the Moon
-        args, kwargs = mock_ax_ground.plot.call_args
+        args, kwargs = mock_ax_ground.scatter.call_args
         az_rad_moon = np.deg2rad(280.0)
         radius_moon = 90 - abs(-15.0)
-        self.assertAlmostEqual(args[0], az_rad_moon)
-        self.assertAlmostEqual(args[1], radius_moon)
-        self.assertEqual(kwargs['label'], 'Moon')
-        
+        np.testing.assert_allclose(args[0], [az_rad_moon])
+        np.testing.assert_allclose(args[1], [radius_moon])
+        _, kwargs = mock_ax_ground.legend.call_args
+        self.assertEqual([h.get_label() for h in kwargs['handles']], ['Moon'])
+
         # Assert that plt.show() was called to display the plot
         mock_plt_show.assert_called_once()
         print("... PASSED")
 
+    @patch('matplotlib.pyplot.show')
+    @patch('matplotlib.pyplot.fignum_exists', return_value=True)
+    @patch('matplotlib.pyplot.subplots')
+    @patch('astroView.viewer.Horizons')
+    def test_visualize_skyview_reuses_figure(self, MockHorizons, mock_subplots, mock_fignum_exists,
+                                             mock_plt_show):
+        """
+        Repeated sky views should redraw into the open figure instead of
+        building new polar axes every call.
+        """
+        print("\nRunning test: test_visualize_skyview_reuses_figure")
+        MockHorizons.return_value.ephemerides.return_value = get_mock_horizons_ephemerides_sun()
+        mock_ax_sky = MagicMock()
+        mock_ax_ground = MagicMock()
+        mock_subplots.return_value = (MagicMock(), (mock_ax_sky, mock_ax_ground))
 
-# The 'skip' decorator is used to prevent these tests from running by default.
+        self.visualizer.visualize_skyview(['Sun'])
+        self.visualizer.visualize_skyview(['Sun'], obs_time_utc='2025-08-05 11:00')
+
+        mock_subplots.assert_called_once()
+        mock_ax_sky.clear.assert_called_once()
+        mock_ax_ground.clear.assert_called_once()
+        self.assertEqual(mock_ax_sky.scatter.call_count, 2)
+        print("... PASSED")
+
+    @patch('matplotlib.pyplot.show')
+    @patch('matplotlib.pyplot.subplots')
+    @patch('astroView.viewer.Horizons')
+    def test_visualize_skyview_time_input(self, MockHorizons, mock_subplots, mock_plt_show):
+        """
+        The observation time may be given as a scalar astropy Time (in any
+        scale) or as a non-'iso' string; arrays of times are rejected.
+        """
+        print("\nRunning test: test_visualize_skyview_time_input")
+        MockHorizons.return_value.ephemerides.return_value = get_mock_horizons_ephemerides_sun()
+        mock_subplots.return_value = (MagicMock(), (MagicMock(), MagicMock()))
+        expected_jd = round(Time('2025-08-05 10:00', scale='utc').jd, 5)
+
+        self.visualizer.visualize_skyview(['Sun'], obs_time_utc=Time('2025-08-05 10:00', scale='utc').tt)
+        _, kwargs = MockHorizons.call_args
+        self.assertEqual(kwargs['epochs'], expected_jd)
+
+        self.visualizer.visualize_skyview(['Sun'], obs_time_utc='2025-08-05T10:00')
+        _, kwargs = MockHorizons.call_args
+        self.assertEqual(kwargs['epochs'], expected_jd)
+
+        with self.assertRaises(ValueError):
+            self.visualizer.visualize_skyview(['Sun'], obs_time_utc=Time(['2025-08-05 10:00', '2025-08-05 11:00']))
+        print("... PASSED")
+
+    @patch('matplotlib.pyplot.show')
+    @patch('matplotlib.pyplot.subplots')
+    @patch('astroView.viewer.Horizons')
+    def test_visualize_skyview_reuses_parsed_time(self, MockHorizons, mock_subplots, mock_plt_show):
+        """
+        Repeating the previous time string should reuse its parsed Time
+        instead of parsing the string again.
+        """
+        print("\nRunning test: test_visualize_skyview_reuses_parsed_time")
+        MockHorizons.return_value.ephemerides.return_value = get_mock_horizons_ephemerides_sun()
+        mock_subplots.return_value = (MagicMock(), (MagicMock(), MagicMock()))
+
+        self.visualizer.visualize_skyview(['Sun'], obs_time_utc='2025-08-05 10:00')
+        self.assertEqual(self.visualizer._last_time_str, '2025-08-05 10:00')
+
+        # Swap the remembered Time: a second call with the same string must pick it up
+        self.visualizer._last_time_obj = Time('2025-08-06 10:00', scale='utc')
+        self.visualizer.visualize_skyview(['Sun'], obs_time_utc='2025-08-05 10:00')
+
+        _, kwargs = MockHorizons.call_args
+        self.assertEqual(kwargs['epochs'], round(Time('2025-08-06 10:00', scale='utc').jd, 5))
+        print("... PASSED")
 
 
-@unittest.skip("Skipping End-to-End tests. Uncomment to run.")
 class TestAsteroidVisualizerE2E(unittest.TestCase):
     """
     End-to-End (E2E) tests for the AsteroidVisualizer.
-    These tests make REAL network calls to JPL Horizons to ensure
-    the full workflow is functioning correctly.
+    These tests run the full workflow against JPL Horizons HTTP responses
+    replayed from vcrpy cassettes in tests/cassettes, with the DE421
+    ephemeris read from the pinned skyfield-data package, so they run offline.
+    With ASTROVIEW_RECORD_CASSETTES=1 missing cassettes are recorded from the
+    REAL Horizons service instead.
     """
     def setUp(self):
-        """Set up a real instance of the visualizer."""
-        self.visualizer = AsteroidVisualizer()
+        """Set up a real instance of the visualizer on the bundled ephemeris."""
+        if skyfield_data is None:
+            self.skipTest("skyfield-data is not installed (pip install .[test])")
+        # Load de421.bsp / finals2000A.all from skyfield-data instead of downloading them
+        data_path = skyfield_data.get_skyfield_data_path()
+        with patch('astroView.viewer.Loader', side_effect=lambda _: Loader(data_path)):
+            # Disable the on-disk query cache; the Horizons helpers never use astroquery's
+            # own cache, so every run goes through the (recorded) HTTP layer
+            self.visualizer = AsteroidVisualizer(cache_dir=None, use_shared=False)
 
+    @use_cassette('ceres_2022_jun.yaml')
     def test_e2e_plot_heliocentric_orbits_3d(self):
         """
-        E2E test that fetches real data for Ceres and generates a plot.
-        This test will fail if there is no internet connection or if the
-        JPL Horizons service is unavailable.
-        """
-        print("\nRunning E2E test: test_e2e_plot_heliocentric_orbits_3d")
-        try:
-            # We use a very short time range to make the test faster.
-            fig = self.visualizer.plot_heliocentric_orbits_3D(
-                object_id='Ceres',
-                start='2025-01-01',
-                stop='2025-01-10',
-                step='1d'
-            )
-            self.assertIsInstance(fig, go.Figure)
-            self.assertEqual(len(fig.data), 5)
-            print("... PASSED")
-        except Exception as e:
-            self.fail(f"E2E test for plotting failed with exception: {e}")
+        E2E test that fetches Ceres vectors from (recorded) Horizons and generates a plot.
+        """
+        fig = self.visualizer.plot_heliocentric_orbits_3D(
+            object_id='Ceres',
+            start='2022-06-10',
+            stop='2022-07-10',
+            step='10d'
+        )
+        self.assertIsInstance(fig, go.Figure)
+        self.assertEqual(len(fig.data), 5)
+
+        # Ceres orbit straight from the recorded vectors, Sun-centred and unflipped
+        ceres = fig.data[1]
+        self.assertEqual(ceres.name, 'Ceres Orbit')
+        self.assertEqual(len(ceres.x), 4)
+        np.testing.assert_allclose(
+            [ceres.x[0], ceres.y[0], ceres.z[0]],
+            [-8.354726583796999E-01, 2.455132459520164E+00, 2.314862198331841E-01]
+        )
 
+        # Earth from DE421 at the same epochs, ~1 AU from the Sun in the ecliptic
+        earth = fig.data[0]
+        self.assertEqual(earth.name, 'Earth Orbit')
+        self.assertEqual(len(earth.x), 4)
+        r_earth = np.hypot(np.hypot(earth.x, earth.y), earth.z)
+        np.testing.assert_allclose(r_earth, 1.0, atol=0.02)
+        np.testing.assert_allclose(earth.z, 0.0, atol=1e-3)
+
+    @use_cassette('skyview_ceres_2000_jan.yaml')
     @patch('matplotlib.pyplot.show')
     def test_e2e_visualize_skyview(self, mock_plt_show):
         """
-        E2E test that fetches real sky positions for the Sun and Moon.
-        """
-        print("\nRunning E2E test: test_e2e_visualize_skyview")
-        try:
-            # We call the function and just check that it runs without error.
-            self.visualizer.visualize_skyview(
-                objects=['Sun', 'Moon'],
-                obs_time_utc='2025-08-05 10:00'
-            )
-            # Check that show was called, indicating the plot was generated.
-            mock_plt_show.assert_called_once()
-            print("... PASSED")
-        except Exception as e:
-            self.fail(f"E2E test for sky view failed with exception: {e}")
+        E2E test that fetches the sky position of Ceres from (recorded) Horizons.
+        """
+        self.visualizer.visualize_skyview(
+            objects=['Ceres'],
+            obs_time_utc='2000-01-01 00:00'
+        )
+        # Check that show was called, indicating the plot was generated.
+        mock_plt_show.assert_called_once()
 
 
 if __name__ == '__main__':